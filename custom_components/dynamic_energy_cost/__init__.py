@@ -70,6 +70,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "sensor",
         )
         _LOGGER.debug("Unloading was successful: %s", unload_ok)
+        if unload_ok:
+            hass.data[DOMAIN].pop(entry.entry_id, None)
         return unload_ok
     except Exception as e:
         _LOGGER.error("Failed to unload sensor platform, error: %s", str(e))
@@ -14,6 +14,28 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required("electricity_price_sensor"): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="sensor", multiple=False),
+        ),
+        vol.Optional("power_sensor"): selector.EntitySelector(
+            selector.EntitySelectorConfig(
+                domain="sensor",
+                multiple=False,
+                device_class="power",
+            ),
+        ),
+        vol.Optional("energy_sensor"): selector.EntitySelector(
+            selector.EntitySelectorConfig(
+                domain="sensor",
+                multiple=False,
+                device_class="energy",
+            ),
+        ),
+    },
+)
+
 
 class DynamicEnergyCostConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Dynamic Energy Cost."""
@@ -31,65 +53,37 @@ class DynamicEnergyCostConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             _LOGGER.info("Received user input: %s", user_input)
-            try:
-                # Validate the electricity price sensor
-                cv.entity_id(user_input["electricity_price_sensor"])
-                if user_input.get("power_sensor"):
-                    cv.entity_id(user_input["power_sensor"])
-                if user_input.get("energy_sensor"):
-                    cv.entity_id(user_input["energy_sensor"])
-
-                # Check that either power sensor or energy sensor is filled
-                if not user_input.get("power_sensor") and not user_input.get(
-                    "energy_sensor",
-                ):
-                    _LOGGER.warning("Neither power nor energy sensor was provided.")
-                    raise vol.Invalid(
-                        "Please enter either a power sensor or an energy sensor, not both.",
-                    )
-                if user_input.get("power_sensor") and user_input.get("energy_sensor"):
-                    _LOGGER.warning("Both power and energy sensors were provided.")
-                    raise vol.Invalid(
-                        "Please enter only one type of sensor (power or energy).",
-                    )
+            power_sensor = user_input.get("power_sensor")
+            energy_sensor = user_input.get("energy_sensor")
 
-                # Create the config dictionary
-                config = {
-                    "electricity_price_sensor": user_input["electricity_price_sensor"],
-                    "power_sensor": user_input.get("power_sensor"),
-                    "energy_sensor": user_input.get("energy_sensor"),
-                }
-                _LOGGER.info("Config entry created successfully.")
-                return self.async_create_entry(title="Dynamic Energy Cost", data=config)
-            except vol.Invalid as err:
-                _LOGGER.error("Validation error: %s", err)
-                errors["base"] = "invalid_entity"
-
-        schema = vol.Schema(
-            {
-                vol.Required("electricity_price_sensor"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor", multiple=False),
-                ),
-                vol.Optional("power_sensor"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        multiple=False,
-                        device_class="power",
-                    ),
-                ),
-                vol.Optional("energy_sensor"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        multiple=False,
-                        device_class="energy",
-                    ),
-                ),
-            },
-        )
+            # Check that either power sensor or energy sensor is filled
+            if not power_sensor and not energy_sensor:
+                _LOGGER.warning("Neither power nor energy sensor was provided.")
+                errors["base"] = "missing_sensor"
+            elif power_sensor and energy_sensor:
+                _LOGGER.warning("Both power and energy sensors were provided.")
+                errors["base"] = "invalid_config"
+            else:
+                try:
+                    # Validate the electricity price sensor
+                    cv.entity_id(user_input["electricity_price_sensor"])
+                    cv.entity_id(power_sensor or energy_sensor)
+                except vol.Invalid as err:
+                    _LOGGER.error("Validation error: %s", err)
+                    errors["base"] = "invalid_entity"
+                else:
+                    # Create the config dictionary
+                    config = {
+                        "electricity_price_sensor": user_input["electricity_price_sensor"],
+                        "power_sensor": power_sensor,
+                        "energy_sensor": energy_sensor,
+                    }
+                    _LOGGER.info("Config entry created successfully.")
+                    return self.async_create_entry(title="Dynamic Energy Cost", data=config)
 
         return self.async_show_form(
             step_id="user",
-            data_schema=schema,
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
             description_placeholders={
                 "electricity_price_sensor": "Electricity Price Sensor",
@@ -1,3 +1,7 @@
+from typing import Literal
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+
 MIN_HA_VERSION = "2024.3"
 
 DOMAIN = "dynamic_energy_cost"
@@ -7,3 +11,8 @@ ENERGY_SENSOR = "energy_sensor"
 SERVICE_RESET_COST = "reset_cost"
 
 DEFAULT_CURRENCY = "EUR"
+
+IntervalType = Literal["daily", "monthly", "yearly"]
+INTERVALS: tuple[IntervalType, ...] = ("daily", "monthly", "yearly")
+
+INVALID_STATES: frozenset[str | None] = frozenset({STATE_UNKNOWN, STATE_UNAVAILABLE, None})
@@ -0,0 +1,163 @@
+import logging
+from datetime import datetime, timedelta
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HassJobType, HomeAssistant, State, callback
+from homeassistant.helpers.event import (
+    EventStateChangedData,
+    async_track_point_in_time,
+    async_track_state_change_event,
+)
+from homeassistant.util.dt import now
+
+from .const import DEFAULT_CURRENCY, INTERVALS, INVALID_STATES, IntervalType
+
+if TYPE_CHECKING:
+    from .energy_based_sensors import BaseEnergyCostSensor
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=8)
+def _next_reset_time(interval: IntervalType, start_of_day: datetime) -> datetime:
+    """Calculate the next reset time, which is the same for every call made on the same day."""
+    if interval == "daily":
+        next_reset = start_of_day + timedelta(days=1)
+    elif interval == "monthly":
+        next_reset = (start_of_day.replace(day=1) + timedelta(days=32)).replace(day=1)
+    elif interval == "yearly":
+        next_reset = start_of_day.replace(year=start_of_day.year + 1, month=1, day=1)
+    return next_reset
+
+
+class EnergyCostCoordinator:
+    """Share the sensor subscriptions and reset timers between the interval sensors of a config entry."""
+
+    def __init__(self, hass: HomeAssistant, energy_sensor_id: str, price_sensor_id: str) -> None:
+        self.hass = hass
+        self.energy_sensor_id = energy_sensor_id
+        self.price_sensor_id = price_sensor_id
+        self.current_energy: float | None = None
+        self.current_price: float | None = None
+        self.currency = self._parse_currency(hass.states.get(price_sensor_id))
+        if self.currency is None:
+            _LOGGER.warning(
+                "Unit of measurement not available or invalid for sensor %s, defaulting to '%s' until it is.",
+                price_sensor_id,
+                DEFAULT_CURRENCY,
+            )
+        self._sensors: dict[IntervalType, list["BaseEnergyCostSensor"]] = {interval: [] for interval in INTERVALS}
+        self._unsub_listeners: list[CALLBACK_TYPE] = []
+        self._unsub_resets: dict[IntervalType, CALLBACK_TYPE] = {}
+        self._reset_jobs = {
+            interval: HassJob(partial(self._async_reset_meters, interval), name=f"{interval} energy cost reset", job_type=HassJobType.Callback)
+            for interval in self._sensors
+        }
+
+    @callback
+    def async_add_sensor(self, sensor: "BaseEnergyCostSensor") -> CALLBACK_TYPE:
+        """Register a sensor for energy updates and resets, returning a callback that unregisters it."""
+        if not self._has_sensors():
+            self._async_start()
+        self._sensors[sensor.interval].append(sensor)
+
+        @callback
+        def _remove_sensor() -> None:
+            self._sensors[sensor.interval].remove(sensor)
+            if not self._has_sensors():
+                self._async_stop()
+
+        return _remove_sensor
+
+    @callback
+    def _async_start(self) -> None:
+        self.current_energy = self._parse_state(self.hass.states.get(self.energy_sensor_id))
+        self.current_price = self._parse_state(self.hass.states.get(self.price_sensor_id))
+        self._unsub_listeners = [
+            async_track_state_change_event(self.hass, self.price_sensor_id, self._async_update_price_event),
+            async_track_state_change_event(self.hass, self.energy_sensor_id, self._async_update_energy_event),
+        ]
+        for interval in self._sensors:
+            self._async_schedule_reset(interval)
+        _LOGGER.debug("Subscribed to %s and %s.", self.energy_sensor_id, self.price_sensor_id)
+
+    @callback
+    def _async_stop(self) -> None:
+        for unsub in (*self._unsub_listeners, *self._unsub_resets.values()):
+            unsub()
+        self._unsub_listeners = []
+        self._unsub_resets = {}
+
+    def _has_sensors(self) -> bool:
+        return any(self._sensors.values())
+
+    @staticmethod
+    def _calculate_next_reset_time(interval: IntervalType) -> datetime:
+        return _next_reset_time(interval, now().replace(hour=0, minute=0, second=0, microsecond=0))
+
+    @callback
+    def _async_schedule_reset(self, interval: IntervalType) -> None:
+        next_reset = self._calculate_next_reset_time(interval)
+        self._unsub_resets[interval] = async_track_point_in_time(self.hass, self._reset_jobs[interval], next_reset)
+
+    @callback
+    def _async_reset_meters(self, interval: IntervalType, reset_time: datetime) -> None:
+        """Reset all sensors of the given interval and reschedule the next reset."""
+        for sensor in self._sensors[interval]:
+            sensor.async_reset()
+        self._async_schedule_reset(interval)
+
+        _LOGGER.debug(
+            "%s meters for %s reset at %s.",
+            interval.capitalize(),
+            self.energy_sensor_id,
+            reset_time.isoformat(),
+        )
+
+    def _parse_state(self, state: State | None) -> float | None:
+        """Parse the numeric value of a sensor state, returning None if it is not usable."""
+        if state is None or state.state in INVALID_STATES:
+            return None
+        try:
+            return float(state.state)
+        except ValueError:
+            _LOGGER.warning("Invalid state '%s' for sensor %s.", state.state, state.entity_id)
+            return None
+
+    def _parse_currency(self, price_state: State | None) -> str | None:
+        """Extract the currency from the unit of measurement of the price sensor."""
+        if price_state is None or not price_state.attributes.get("unit_of_measurement"):
+            return None
+        currency = price_state.attributes["unit_of_measurement"].split("/")[0].strip()
+        _LOGGER.debug("Extracted currency '%s' from unit of measurement '%s'.", currency, price_state.attributes["unit_of_measurement"])
+        return currency
+
+    @callback
+    def _async_update_price_event(self, event: Event[EventStateChangedData]) -> None:
+        """Cache the latest electricity price so energy updates don't need to look it up."""
+        new_state = event.data.get("new_state")
+        self.current_price = self._parse_state(new_state)
+
+        if self.currency is None and (currency := self._parse_currency(new_state)) is not None:
+            # The price sensor wasn't loaded yet when the sensors were set up
+            self.currency = currency
+            for sensors in self._sensors.values():
+                for sensor in sensors:
+                    sensor.async_set_currency(currency)
+
+    @callback
+    def _async_update_energy_event(self, event: Event[EventStateChangedData]) -> None:
+        """Parse the new energy reading once and pass it on to every interval sensor."""
+        current_energy = self.current_energy = self._parse_state(event.data.get("new_state"))
+        if current_energy is None:
+            _LOGGER.debug("New state is unknown or unavailable, skipping update.")
+            return
+        price = self.current_price
+        if price is None:
+            _LOGGER.warning("Price sensor %s is unavailable. Skipping update.", self.price_sensor_id)
+            return
+
+        for sensors in self._sensors.values():
+            for sensor in sensors:
+                sensor.async_apply_energy_reading(current_energy, price)
@@ -15,7 +15,7 @@ from homeassistant.helpers.event import (
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.util.dt import now
 
-from .const import DOMAIN
+from .const import DOMAIN, INTERVALS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -72,6 +72,11 @@ class RealTimeCostSensor(SensorEntity):
         """Return the unit of measurement."""
         return "EUR/h"
 
+    @property
+    def should_poll(self):
+        """No need to poll. Updated on price and power state changes."""
+        return False
+
     @callback
     def handle_state_change(self, event):
         """Handle changes to the electricity price or power usage."""
@@ -118,8 +123,7 @@ def async_setup_entry(hass, config_entry, async_add_entities):
     async_add_entities([real_time_cost_sensor])
 
     # Utility Meter Sensors setup
-    intervals = ["daily", "monthly", "yearly"]
-    utility_sensors = [UtilityMeterSensor(hass, real_time_cost_sensor, interval) for interval in intervals]
+    utility_sensors = [UtilityMeterSensor(hass, real_time_cost_sensor, interval) for interval in INTERVALS]
     async_add_entities(utility_sensors)
 
 
@@ -134,6 +138,7 @@ class UtilityMeterSensor(SensorEntity, RestoreEntity):
         self._interval = interval
         self._state = Decimal("0.00")
         self._last_update = now()
+        self._reset_timer = None
         base_name = real_time_cost_sensor.name.replace(" Real Time Energy Cost", "").strip()
         self._name = f"{base_name} {interval.title()} Energy Cost"
 
@@ -150,7 +155,9 @@ class UtilityMeterSensor(SensorEntity, RestoreEntity):
         self.schedule_next_reset()
         _LOGGER.debug("Registering state change event for: %s", self._real_time_cost_sensor.entity_id)
         try:
-            async_track_state_change_event(self.hass, [self._real_time_cost_sensor.entity_id], self._handle_real_time_cost_update)
+            self.async_on_remove(
+                async_track_state_change_event(self.hass, [self._real_time_cost_sensor.entity_id], self._handle_real_time_cost_update),
+            )
         except Exception as e:
             _LOGGER.error("Failed to track state change: %s", str(e))
 
@@ -181,8 +188,7 @@ class UtilityMeterSensor(SensorEntity, RestoreEntity):
         next_reset_time = self.calculate_next_reset_time()
 
         # Cancel existing scheduled reset if it exists
-        if hasattr(self, "_reset_timer"):
-            self.hass.async_create_task(self.hass.async_remove_job(self._reset_timer))
+        self._cancel_reset_timer()
 
         # Log the scheduling of the next reset
         _LOGGER.debug(f"Scheduling next reset for {self._name} at {next_reset_time}")
@@ -191,8 +197,20 @@ class UtilityMeterSensor(SensorEntity, RestoreEntity):
         self._reset_timer = async_track_point_in_time(self.hass, self._reset_meter, next_reset_time)
         _LOGGER.debug("Next reset scheduled successfully.")
 
+    @callback
+    def _cancel_reset_timer(self):
+        """Cancel the scheduled reset, if any."""
+        if self._reset_timer is not None:
+            self._reset_timer()
+            self._reset_timer = None
+
+    async def async_will_remove_from_hass(self):
+        """Cancel the scheduled reset when the sensor is removed."""
+        self._cancel_reset_timer()
+
     async def _reset_meter(self, _):
         """Reset the meter at the specified interval."""
+        self._reset_timer = None
         self._state = Decimal("0.00")
         self._last_update = now()
         self.async_write_ha_state()
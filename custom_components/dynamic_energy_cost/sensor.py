@@ -8,16 +8,15 @@ from homeassistant.helpers.entity_platform import (
 )
 
 from .const import (
+    DOMAIN,
     ELECTRICITY_PRICE_SENSOR,
     ENERGY_SENSOR,
+    INTERVALS,
     POWER_SENSOR,
     SERVICE_RESET_COST,
 )
-from .energy_based_sensors import (
-    DailyEnergyCostSensor,
-    MonthlyEnergyCostSensor,
-    YearlyEnergyCostSensor,
-)
+from .coordinator import EnergyCostCoordinator
+from .energy_based_sensors import BaseEnergyCostSensor
 from .power_based_sensors import RealTimeCostSensor, UtilityMeterSensor
 
 _LOGGER = logging.getLogger(__name__)
@@ -51,19 +50,17 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
             "Real Time Energy Cost",
         )
         sensors.append(real_time_cost_sensor)
-        intervals = ["daily", "monthly", "yearly"]
-        utility_sensors = [UtilityMeterSensor(hass, real_time_cost_sensor, interval) for interval in intervals]
-        sensors.extend(utility_sensors)
+        sensors.extend(UtilityMeterSensor(hass, real_time_cost_sensor, interval) for interval in INTERVALS)
 
     if data.get(ENERGY_SENSOR):
         # Setup energy-based sensors
         energy_sensor = data[ENERGY_SENSOR]
-        sensors.append(DailyEnergyCostSensor(hass, energy_sensor, electricity_price_sensor))
-        sensors.append(MonthlyEnergyCostSensor(hass, energy_sensor, electricity_price_sensor))
-        sensors.append(YearlyEnergyCostSensor(hass, energy_sensor, electricity_price_sensor))
+        coordinator = EnergyCostCoordinator(hass, energy_sensor, electricity_price_sensor)
+        hass.data[DOMAIN][config_entry.entry_id] = coordinator
+        sensors.extend(BaseEnergyCostSensor(hass, coordinator, interval) for interval in INTERVALS)
 
     if sensors:
-        async_add_entities(sensors, True)
+        async_add_entities(sensors)
     else:
         _LOGGER.error("No sensors configured. Check your configuration.")
 